@@ -5,14 +5,9 @@ This module provides a graphical user interface (GUI) for a simple banking syste
 Users can create accounts, deposit money, withdraw money, check balances, and view transaction statements.
 """
 
-import customtkinter as ctk
-from tkinter import messagebox
+from collections import namedtuple
 from typing import Dict, List, Tuple
 
-# Configure CustomTkinter
-ctk.set_appearance_mode("System")  # Modes: "System", "Dark", "Light"
-ctk.set_default_color_theme("blue")  # Themes: "blue", "green", "dark-blue"
-
 # Custom Exceptions
 class InvalidAmountError(Exception):
     """Raised when an invalid amount is provided (e.g., negative amount)."""
@@ -22,6 +17,9 @@ class InsufficientBalanceError(Exception):
     """Raised when there is insufficient balance for a withdrawal."""
     pass
 
+# Transaction record: type, amount and the balance right after it was applied
+Tx = namedtuple("Tx", "type amount balance")
+
 # Banking System Functions
 class Account:
     def __init__(self, name: str, initial_balance: float = 0.0):
@@ -49,7 +47,7 @@ class Account:
             raise InvalidAmountError("Deposit amount must be positive.")
 
         self.balance += amount
-        self.transactions.append(("Deposit", amount))
+        self.transactions.append(Tx("Deposit", amount, self.balance))
 
     def withdraw(self, amount: float) -> None:
         """
@@ -65,7 +63,7 @@ class Account:
             raise InsufficientBalanceError("Insufficient balance for withdrawal.")
 
         self.balance -= amount
-        self.transactions.append(("Withdrawal", amount))
+        self.transactions.append(Tx("Withdrawal", amount, self.balance))
 
     def check_balance(self) -> float:
         """
@@ -81,145 +79,186 @@ class Account:
 
         :return: Formatted transaction statement
         """
-        statement = f"Account statement for {self.name}:\n"
+        parts = [f"Account statement for {self.name}:\n"]
         if not self.transactions:
-            statement += "No transactions yet."
+            parts.append("No transactions yet.")
         else:
-            balance = 0.0
-            for transaction in self.transactions:
-                transaction_type, amount = transaction
-                if transaction_type == "Deposit":
-                    balance += amount
-                elif transaction_type == "Withdrawal":
-                    balance -= amount
-                statement += f"- {transaction_type}: ${amount:.2f}. New Balance: ${balance:.2f}.\n"
-        return statement
+            append = parts.append
+            for transaction_type, amount, balance in self.transactions:
+                append(f"- {transaction_type}: ${amount:.2f}. New Balance: ${balance:.2f}.\n")
+        return "".join(parts)
 
 # GUI Application
-class BankingApp(ctk.CTk):
-    def __init__(self):
-        super().__init__()
-        self.title("Banking System")
-        self.geometry("500x700")
-        self.account = None
-
-        # Create UI Elements
-        self.create_widgets()
-
-    def create_widgets(self):
-        """Creates and places all UI elements."""
-        # Title Label
-        self.title_label = ctk.CTkLabel(self, text="Banking System", font=("Arial", 24, "bold"))
-        self.title_label.pack(pady=10)
-
-        # Name Entry
-        self.name_label = ctk.CTkLabel(self, text="Account Name:")
-        self.name_label.pack()
-        self.name_entry = ctk.CTkEntry(self, width=200)
-        self.name_entry.pack(pady=5)
-
-        # Initial Balance Entry
-        self.balance_label = ctk.CTkLabel(self, text="Initial Balance:")
-        self.balance_label.pack()
-        self.balance_entry = ctk.CTkEntry(self, width=200)
-        self.balance_entry.pack(pady=5)
-
-        # Create Account Button
-        self.create_button = ctk.CTkButton(self, text="Create Account", command=self.create_account)
-        self.create_button.pack(pady=10)
-
-        # Deposit Entry
-        self.deposit_label = ctk.CTkLabel(self, text="Deposit Amount:")
-        self.deposit_label.pack()
-        self.deposit_entry = ctk.CTkEntry(self, width=200)
-        self.deposit_entry.pack(pady=5)
-
-        # Deposit Button
-        self.deposit_button = ctk.CTkButton(self, text="Deposit", command=self.deposit)
-        self.deposit_button.pack(pady=10)
-
-        # Withdraw Entry
-        self.withdraw_label = ctk.CTkLabel(self, text="Withdraw Amount:")
-        self.withdraw_label.pack()
-        self.withdraw_entry = ctk.CTkEntry(self, width=200)
-        self.withdraw_entry.pack(pady=5)
-
-        # Withdraw Button
-        self.withdraw_button = ctk.CTkButton(self, text="Withdraw", command=self.withdraw)
-        self.withdraw_button.pack(pady=10)
-
-        # Check Balance Button
-        self.balance_button = ctk.CTkButton(self, text="Check Balance", command=self.show_balance)
-        self.balance_button.pack(pady=10)
-
-        # Print Statement Button
-        self.statement_button = ctk.CTkButton(self, text="Print Statement", command=self.show_statement)
-        self.statement_button.pack(pady=10)
-
-    def create_account(self):
-        """Creates a new account."""
-        name = self.name_entry.get()
-        initial_balance = self.balance_entry.get()
-        try:
-            initial_balance = float(initial_balance)
-            self.account = Account(name, initial_balance)
-            messagebox.showinfo("Success", f"Account created for {name} with initial balance ${initial_balance:.2f}.")
-        except ValueError:
-            messagebox.showerror("Error", "Initial balance must be a number.")
-        except InvalidAmountError as e:
-            messagebox.showerror("Error", str(e))
-
-    def deposit(self):
-        """Deposits money into the account."""
-        if not self.account:
-            messagebox.showerror("Error", "No account found. Please create an account first.")
-            return
-
-        amount = self.deposit_entry.get()
-        try:
-            amount = float(amount)
-            self.account.deposit(amount)
-            messagebox.showinfo("Success", f"Deposited ${amount:.2f}. New balance: ${self.account.balance:.2f}.")
-        except ValueError:
-            messagebox.showerror("Error", "Deposit amount must be a number.")
-        except InvalidAmountError as e:
-            messagebox.showerror("Error", str(e))
-
-    def withdraw(self):
-        """Withdraws money from the account."""
-        if not self.account:
-            messagebox.showerror("Error", "No account found. Please create an account first.")
-            return
-
-        amount = self.withdraw_entry.get()
-        try:
-            amount = float(amount)
-            self.account.withdraw(amount)
-            messagebox.showinfo("Success", f"Withdrew ${amount:.2f}. New balance: ${self.account.balance:.2f}.")
-        except ValueError:
-            messagebox.showerror("Error", "Withdrawal amount must be a number.")
-        except (InvalidAmountError, InsufficientBalanceError) as e:
-            messagebox.showerror("Error", str(e))
-
-    def show_balance(self):
-        """Displays the current balance."""
-        if not self.account:
-            messagebox.showerror("Error", "No account found. Please create an account first.")
-            return
-
-        balance = self.account.check_balance()
-        messagebox.showinfo("Balance", f"Current balance: ${balance:.2f}.")
-
-    def show_statement(self):
-        """Displays the transaction statement."""
-        if not self.account:
-            messagebox.showerror("Error", "No account found. Please create an account first.")
-            return
-
-        statement = self.account.print_statement()
-        messagebox.showinfo("Transaction Statement", statement)
+def _ui():
+    """
+    Imports and configures CustomTkinter, then builds the GUI class.
+
+    Deferred so the account logic can be imported without loading Tk.
+
+    :return: The BankingApp class
+    """
+    import customtkinter as ctk
+
+    # Configure CustomTkinter
+    ctk.set_appearance_mode("System")  # Modes: "System", "Dark", "Light"
+    ctk.set_default_color_theme("blue")  # Themes: "blue", "green", "dark-blue"
+
+    class BankingApp(ctk.CTk):
+        def __init__(self):
+            super().__init__()
+            self.title("Banking System")
+            self.geometry("500x900")
+            self.account = None
+            self._toast_job = None
+
+            # Create UI Elements
+            self.create_widgets()
+
+        def create_widgets(self):
+            """Creates and places all UI elements."""
+            # Title Label
+            self.title_label = ctk.CTkLabel(self, text="Banking System", font=("Arial", 24, "bold"))
+            self.title_label.pack(pady=10)
+
+            # Name Entry
+            self.name_label = ctk.CTkLabel(self, text="Account Name:")
+            self.name_label.pack()
+            self.name_entry = ctk.CTkEntry(self, width=200)
+            self.name_entry.pack(pady=5)
+
+            # Initial Balance Entry
+            self.balance_label = ctk.CTkLabel(self, text="Initial Balance:")
+            self.balance_label.pack()
+            self.balance_entry = ctk.CTkEntry(self, width=200)
+            self.balance_entry.pack(pady=5)
+
+            # Create Account Button
+            self.create_button = ctk.CTkButton(self, text="Create Account", command=self.create_account)
+            self.create_button.pack(pady=10)
+
+            # Deposit Entry
+            self.deposit_label = ctk.CTkLabel(self, text="Deposit Amount:")
+            self.deposit_label.pack()
+            self.deposit_entry = ctk.CTkEntry(self, width=200)
+            self.deposit_entry.pack(pady=5)
+
+            # Deposit Button
+            self.deposit_button = ctk.CTkButton(self, text="Deposit", command=self.deposit)
+            self.deposit_button.pack(pady=10)
+
+            # Withdraw Entry
+            self.withdraw_label = ctk.CTkLabel(self, text="Withdraw Amount:")
+            self.withdraw_label.pack()
+            self.withdraw_entry = ctk.CTkEntry(self, width=200)
+            self.withdraw_entry.pack(pady=5)
+
+            # Withdraw Button
+            self.withdraw_button = ctk.CTkButton(self, text="Withdraw", command=self.withdraw)
+            self.withdraw_button.pack(pady=10)
+
+            # Check Balance Button
+            self.balance_button = ctk.CTkButton(self, text="Check Balance", command=self.show_balance)
+            self.balance_button.pack(pady=10)
+
+            # Print Statement Button
+            self.statement_button = ctk.CTkButton(self, text="Print Statement", command=self.show_statement)
+            self.statement_button.pack(pady=10)
+
+            # Status Label
+            self.status_label = ctk.CTkLabel(self, text="", wraplength=450, justify="left")
+            self.status_label.pack(pady=5)
+
+            # Statement Box (read-only, scrolls for long statements)
+            self.statement_box = ctk.CTkTextbox(self, width=450, height=200, state="disabled")
+            self.statement_box.pack(pady=10)
+
+        def _toast(self, message: str, err: bool = False) -> None:
+            """
+            Shows a status message in the status label without blocking the event loop.
+
+            :param message: Text to display
+            :param err: Whether the message reports an error
+            """
+            self.status_label.configure(text=message, text_color=("red" if err else "green"))
+            if self._toast_job is not None:
+                self.after_cancel(self._toast_job)
+            self._toast_job = self.after(3000, self._clear_toast)
+
+        def _clear_toast(self) -> None:
+            """Clears the status label."""
+            self._toast_job = None
+            self.status_label.configure(text="")
+
+        def create_account(self):
+            """Creates a new account."""
+            name = self.name_entry.get()
+            initial_balance = self.balance_entry.get()
+            try:
+                initial_balance = float(initial_balance)
+                self.account = Account(name, initial_balance)
+                self._toast(f"Account created for {name} with initial balance ${initial_balance:.2f}.")
+            except ValueError:
+                self._toast("Initial balance must be a number.", err=True)
+            except InvalidAmountError as e:
+                self._toast(str(e), err=True)
+
+        def deposit(self):
+            """Deposits money into the account."""
+            if not self.account:
+                self._toast("No account found. Please create an account first.", err=True)
+                return
+
+            amount = self.deposit_entry.get()
+            try:
+                amount = float(amount)
+                self.account.deposit(amount)
+                self._toast(f"Deposited ${amount:.2f}. New balance: ${self.account.balance:.2f}.")
+            except ValueError:
+                self._toast("Deposit amount must be a number.", err=True)
+            except InvalidAmountError as e:
+                self._toast(str(e), err=True)
+
+        def withdraw(self):
+            """Withdraws money from the account."""
+            if not self.account:
+                self._toast("No account found. Please create an account first.", err=True)
+                return
+
+            amount = self.withdraw_entry.get()
+            try:
+                amount = float(amount)
+                self.account.withdraw(amount)
+                self._toast(f"Withdrew ${amount:.2f}. New balance: ${self.account.balance:.2f}.")
+            except ValueError:
+                self._toast("Withdrawal amount must be a number.", err=True)
+            except (InvalidAmountError, InsufficientBalanceError) as e:
+                self._toast(str(e), err=True)
+
+        def show_balance(self):
+            """Displays the current balance."""
+            if not self.account:
+                self._toast("No account found. Please create an account first.", err=True)
+                return
+
+            balance = self.account.check_balance()
+            self._toast(f"Current balance: ${balance:.2f}.")
+
+        def show_statement(self):
+            """Displays the transaction statement."""
+            if not self.account:
+                self._toast("No account found. Please create an account first.", err=True)
+                return
+
+            statement = self.account.print_statement()
+            self.statement_box.configure(state="normal")
+            self.statement_box.delete("1.0", "end")
+            self.statement_box.insert("1.0", statement)
+            self.statement_box.configure(state="disabled")
+
+    return BankingApp
 
 # Run the Application
 if __name__ == "__main__":
+    BankingApp = _ui()
     app = BankingApp()
     app.mainloop()
\ No newline at end of file
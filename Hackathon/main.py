@@ -1,34 +1,81 @@
+from collections import deque
+from itertools import islice
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import random
-import hashlib
+from typing import Deque, Dict, Iterable, List, NamedTuple, Optional, Tuple
+import json
+import secrets
+import tempfile
+import time
+import os
 from abc import ABC, abstractmethod
 from enum import Enum
 import re
 
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Enum whose members are also plain strings."""
+        def __str__(self) -> str:
+            return self.value
+
+# Precompiled validation patterns
+_NAME_RE = re.compile(r'^[A-Za-z ]{2,50}\Z')
+_USER_RE = re.compile(r'^[A-Za-z0-9_]{4,20}\Z')
+_SPECIAL_CHARS = frozenset('!@#$%^&*(),.?":{}|<>')
+
 class AccountType(Enum):
     SAVINGS = "Savings"
     CURRENT = "Current"
 
-class TransactionType(Enum):
+class TransactionType(StrEnum):
     DEPOSIT = "Deposit"
     WITHDRAWAL = "Withdrawal"
     TRANSFER_SENT = "Transfer Sent"
     TRANSFER_RECEIVED = "Transfer Received"
     INTEREST_CREDIT = "Interest Credit"
 
+class Tx(NamedTuple):
+    """A single stored transaction record (ts in epoch seconds)."""
+    ts: float
+    type: str
+    amount: float
+    balance: float
+
+class StatementEntry(NamedTuple):
+    """A transaction as shown on a statement (timestamp as "YYYY-MM-DD HH:MM:SS")."""
+    timestamp: str
+    type: str
+    amount: float
+    balance: float
+
 class BankingError(Exception):
     """Custom exception for banking operations"""
     pass
 
 class Account(ABC):
-    def __init__(self, account_number: str, account_holder: str, account_type: AccountType):
+    __slots__ = ('_account_number', '_account_holder', '_balance', '_transactions',
+                 '_tx_archive_path', '_tx_archive_buffer', '_tx_archived', '_tx_archive_owner',
+                 '_account_type', '_account_type_str', '_is_active', '_stats')
+    TRANSACTION_WINDOW = 256  # recent transactions kept in memory
+    ARCHIVE_BATCH_SIZE = 64  # evicted transactions buffered per archive write
+    
+    def __init__(self, account_number: str, account_holder: str, account_type: AccountType,
+                 stats: Optional[Dict] = None, archive_path: Optional[str] = None):
         self._account_number: str = account_number
         self._account_holder: str = account_holder
         self._balance: float = 0.0
-        self._transactions: List[Dict] = []
+        # Without an archive nothing may be evicted, so the history stays unbounded
+        self._transactions: Deque[Tx] = deque(
+            maxlen=self.TRANSACTION_WINDOW if archive_path is not None else None)
+        self._tx_archive_path: Optional[str] = archive_path
+        self._tx_archive_buffer: List[Tx] = []
+        self._tx_archived: bool = False  # whether this account has written its archive file yet
+        self._tx_archive_owner = None  # keeps the bank's temporary archive directory alive
         self._account_type: AccountType = account_type
+        self._account_type_str: str = account_type.value
         self._is_active: bool = True
+        self._stats: Optional[Dict] = stats  # owning bank's running counters
         
     @abstractmethod
     def calculate_interest(self) -> float:
@@ -54,7 +101,7 @@ class Account(ABC):
         if amount <= 0:
             raise BankingError("Invalid deposit amount")
         
-        self._balance += amount
+        self._change_balance(amount)
         self._add_transaction(TransactionType.DEPOSIT, amount)
         return True
         
@@ -71,6 +118,13 @@ class Account(ABC):
         Raises:
             BankingError: If insufficient balance or invalid amount
         """
+        self._check_withdrawal(amount)
+        self._change_balance(-amount)
+        self._add_transaction(TransactionType.WITHDRAWAL, -amount)
+        return True
+    
+    def _check_withdrawal(self, amount: float):
+        """Raise BankingError if the amount cannot be taken out of this account."""
         if not self._is_active:
             raise BankingError("Account is inactive")
             
@@ -79,39 +133,98 @@ class Account(ABC):
             
         if amount > self._balance:
             raise BankingError("Insufficient balance")
-        
-        self._balance -= amount
-        self._add_transaction(TransactionType.WITHDRAWAL, -amount)
-        return True
     
     def get_balance(self) -> float:
         """Return current balance."""
         return self._balance
+    
+    def _change_balance(self, delta: float):
+        """Apply a balance change and keep the bank's deposit total in sync."""
+        self._balance += delta
+        if self._stats is not None:
+            self._stats['total_deposits'] += delta
         
-    def _add_transaction(self, transaction_type: TransactionType, amount: float):
-        """Add a transaction to the transaction history."""
-        transaction = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'type': transaction_type.value,
-            'amount': amount,
-            'balance': self._balance
-        }
-        self._transactions.append(transaction)
+    def _apply_transfer(self, delta: float, transaction_type: TransactionType, timestamp: float):
+        """Apply one side of a validated transfer as a single balance change and record."""
+        self._change_balance(delta)
+        self._add_transaction(transaction_type, delta, timestamp)
         
-    def get_statement(self) -> Tuple[str, List[Dict]]:
+    def _add_transaction(self, transaction_type: TransactionType, amount: float,
+                         timestamp: Optional[float] = None):
+        """Add a transaction to the transaction history (timestamp as epoch seconds)."""
+        transaction = Tx(time.time() if timestamp is None else timestamp,
+                         transaction_type, amount, self._balance)
+        if len(self._transactions) == self._transactions.maxlen:
+            self._tx_archive_buffer.append(self._transactions[0])
+        self._transactions.append(transaction)
+        if len(self._tx_archive_buffer) >= self.ARCHIVE_BATCH_SIZE:
+            try:
+                self._flush_archive()
+            except OSError:
+                pass  # rows stay buffered and are retried on the next flush
+    
+    def _flush_archive(self):
         """
-        Get account statement.
+        Write buffered transactions that left the in-memory window to the archive file.
         
-        Returns:
-            Tuple containing account info and list of transactions
+        Raises:
+            OSError: If the archive cannot be written; the buffer is kept intact
         """
-        account_info = (
+        if not self._tx_archive_buffer:
+            return
+        os.makedirs(os.path.dirname(self._tx_archive_path) or ".", exist_ok=True)
+        # The first write truncates, so a reused account number never sees old rows
+        with open(self._tx_archive_path, 'a' if self._tx_archived else 'w') as archive:
+            archive.writelines(json.dumps(t._asdict()) + "\n" for t in self._tx_archive_buffer)
+        self._tx_archived = True
+        self._tx_archive_buffer.clear()
+    
+    @staticmethod
+    def _format_transactions(transactions: Iterable[Tx]) -> List[StatementEntry]:
+        """Convert stored transactions into statement entries with readable timestamps."""
+        return [
+            StatementEntry(datetime.fromtimestamp(t.ts).strftime("%Y-%m-%d %H:%M:%S"),
+                           t.type, t.amount, t.balance)
+            for t in transactions
+        ]
+    
+    def _statement_header(self) -> str:
+        """Build the account info block shown at the top of a statement."""
+        return (
             f"Account Statement for {self._account_holder}\n"
             f"Account Number: {self._account_number}\n"
-            f"Account Type: {self._account_type.value}\n"
+            f"Account Type: {self._account_type_str}\n"
             f"Account Status: {'Active' if self._is_active else 'Inactive'}"
         )
-        return account_info, self._transactions
+        
+    def get_statement(self) -> Tuple[str, List[StatementEntry]]:
+        """
+        Get account statement covering the most recent transactions.
+        
+        Returns:
+            Tuple containing account info and list of recent transactions,
+            with timestamps formatted as "YYYY-MM-DD HH:MM:SS"
+        """
+        recent = islice(self._transactions, max(0, len(self._transactions) - self.TRANSACTION_WINDOW), None)
+        return self._statement_header(), self._format_transactions(recent)
+    
+    def get_full_statement(self) -> Tuple[str, List[StatementEntry]]:
+        """
+        Get complete account statement, including archived transactions.
+        
+        Returns:
+            Tuple containing account info and the full list of transactions,
+            with timestamps formatted as "YYYY-MM-DD HH:MM:SS"
+        """
+        archived: List[Tx] = []
+        if self._tx_archived:
+            with open(self._tx_archive_path) as archive:
+                for line in archive:
+                    record = json.loads(line)
+                    record['type'] = TransactionType(record['type'])
+                    archived.append(Tx(**record))
+        history = archived + self._tx_archive_buffer + list(self._transactions)
+        return self._statement_header(), self._format_transactions(history)
     
     @property
     def account_number(self) -> str:
@@ -128,70 +241,105 @@ class Account(ABC):
     def toggle_account_status(self):
         """Toggle account between active and inactive states."""
         self._is_active = not self._is_active
+        if self._stats is not None:
+            delta = 1 if self._is_active else -1
+            self._stats['active'] += delta
+            self._stats['inactive'] -= delta
 
 class SavingsAccount(Account):
+    __slots__ = ()
     INTEREST_RATE = 0.045  # 4.5% annual interest rate
+    MONTHLY_RATE = INTEREST_RATE / 12
     MINIMUM_BALANCE = 1000.0
     
-    def __init__(self, account_number: str, account_holder: str):
-        super().__init__(account_number, account_holder, AccountType.SAVINGS)
+    def __init__(self, account_number: str, account_holder: str, stats: Optional[Dict] = None,
+                 archive_path: Optional[str] = None):
+        super().__init__(account_number, account_holder, AccountType.SAVINGS, stats, archive_path)
         
     def calculate_interest(self) -> float:
         """Calculate monthly interest for savings account."""
-        monthly_interest = (self._balance * self.INTEREST_RATE) / 12
-        self._balance += monthly_interest
-        self._add_transaction(TransactionType.INTEREST_CREDIT, monthly_interest)
+        monthly_interest = self._balance * self.MONTHLY_RATE
+        self._credit_interest(monthly_interest)
         return monthly_interest
     
-    def withdraw(self, amount: float) -> bool:
-        """Override withdraw to enforce minimum balance."""
+    def _credit_interest(self, interest: float, timestamp: Optional[float] = None):
+        """Add already-computed interest to the balance and record it."""
+        self._change_balance(interest)
+        self._add_transaction(TransactionType.INTEREST_CREDIT, interest, timestamp)
+    
+    def _check_withdrawal(self, amount: float):
+        """Override withdrawal check to enforce minimum balance."""
         if (self._balance - amount) < self.MINIMUM_BALANCE:
             raise BankingError(f"Must maintain minimum balance of {self.MINIMUM_BALANCE}")
-        return super().withdraw(amount)
+        super()._check_withdrawal(amount)
 
 class CurrentAccount(Account):
+    __slots__ = ()
     OVERDRAFT_LIMIT = 10000.0
     
-    def __init__(self, account_number: str, account_holder: str):
-        super().__init__(account_number, account_holder, AccountType.CURRENT)
+    def __init__(self, account_number: str, account_holder: str, stats: Optional[Dict] = None,
+                 archive_path: Optional[str] = None):
+        super().__init__(account_number, account_holder, AccountType.CURRENT, stats, archive_path)
         
     def calculate_interest(self) -> float:
         """Current accounts don't earn interest."""
         return 0.0
     
-    def withdraw(self, amount: float) -> bool:
-        """Override withdraw to allow overdraft up to limit."""
+    def _check_withdrawal(self, amount: float):
+        """Override withdrawal check to allow overdraft up to limit."""
         if (self._balance - amount) < -self.OVERDRAFT_LIMIT:
             raise BankingError(f"Exceeds overdraft limit of {self.OVERDRAFT_LIMIT}")
-        return super().withdraw(amount)
+        super()._check_withdrawal(amount)
 
 class User:
+    __slots__ = ('username', 'salt', 'password_hash')
+    PBKDF2_ITERATIONS = 100_000
+    
     def __init__(self, username: str, password: str):
         self.username = username
-        self.password_hash = self._hash_password(password)
+        self.salt = os.urandom(16)
+        self.password_hash = self._hash_password(password, self.salt)
         
-    @staticmethod
-    def _hash_password(password: str) -> str:
-        """Hash password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    @classmethod
+    def _hash_password(cls, password: str, salt: bytes) -> bytes:
+        """Derive a salted password hash using PBKDF2-HMAC-SHA256."""
+        import hashlib  # deferred: only needed when a User is created or verified
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, cls.PBKDF2_ITERATIONS)
     
     def verify_password(self, password: str) -> bool:
-        """Verify if provided password matches stored hash."""
-        return self._hash_password(password) == self.password_hash
+        """Verify if provided password matches stored hash (constant-time)."""
+        import hmac  # deferred: only needed when a User is verified
+        return hmac.compare_digest(self._hash_password(password, self.salt), self.password_hash)
 
 class Bank:
-    def __init__(self):
+    def __init__(self, archive_dir: Optional[str] = None):
+        # Transaction archives live in archive_dir, or in a temporary directory
+        # removed once this bank and all of its accounts are gone
+        self._archive_tmp: Optional[tempfile.TemporaryDirectory] = None
+        if archive_dir is None:
+            self._archive_tmp = tempfile.TemporaryDirectory(prefix="bank-tx-")
+            archive_dir = self._archive_tmp.name
+        self._archive_dir: str = archive_dir
         self._accounts: Dict[str, Account] = {}
         self._users: Dict[str, User] = {}
-        self._account_holders: Dict[str, List[str]] = {}  # username -> account numbers
+        self._account_holders: Dict[str, List[Account]] = {}  # username -> accounts
+        # Accounts partitioned by type, filled in by open_account
+        self._savings: List[SavingsAccount] = []
+        self._current: List[CurrentAccount] = []
+        # Running counters kept up to date by open_account and the accounts themselves
+        self._stats: Dict = {
+            'active': 0,
+            'inactive': 0,
+            'total_deposits': 0.0
+        }
         
     def _validate_name(self, name: str) -> bool:
         """Validate account holder name."""
-        return bool(re.match(r'^[A-Za-z\s]{2,50}$', name))
+        return bool(_NAME_RE.match(name))
     
     def _validate_username(self, username: str) -> bool:
         """Validate username."""
-        return bool(re.match(r'^[A-Za-z0-9_]{4,20}$', username))
+        return bool(_USER_RE.match(username))
     
     def _validate_password(self, password: str) -> bool:
         """
@@ -203,20 +351,25 @@ class Bank:
         """
         if len(password) < 8:
             return False
-        if not re.search(r'[A-Z]', password):
-            return False
-        if not re.search(r'[a-z]', password):
-            return False
-        if not re.search(r'[0-9]', password):
-            return False
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
-            return False
-        return True
+        # Single pass: one bit per required character class
+        flags = 0
+        for c in password:
+            if 'A' <= c <= 'Z':
+                flags |= 1
+            elif 'a' <= c <= 'z':
+                flags |= 2
+            elif '0' <= c <= '9':
+                flags |= 4
+            elif c in _SPECIAL_CHARS:
+                flags |= 8
+            if flags == 15:
+                return True
+        return False
         
     def _generate_account_number(self) -> str:
         """Generate a unique 10-digit account number."""
         while True:
-            account_number = ''.join([str(random.randint(0, 9)) for _ in range(10)])
+            account_number = f"{secrets.randbelow(10_000_000_000):010d}"
             if account_number not in self._accounts:
                 return account_number
     
@@ -271,14 +424,19 @@ class Bank:
             raise BankingError("Invalid account holder name")
         
         account_number = self._generate_account_number()
+        archive_path = os.path.join(self._archive_dir, f"{account_number}.jsonl")
         
         if account_type == AccountType.SAVINGS:
-            account = SavingsAccount(account_number, account_holder)
+            account = SavingsAccount(account_number, account_holder, self._stats, archive_path)
+            self._savings.append(account)
         else:
-            account = CurrentAccount(account_number, account_holder)
+            account = CurrentAccount(account_number, account_holder, self._stats, archive_path)
+            self._current.append(account)
+        account._tx_archive_owner = self._archive_tmp
+        self._stats['active'] += 1
             
         self._accounts[account_number] = account
-        self._account_holders[username].append(account_number)
+        self._account_holders[username].append(account)
         return account_number
     
     def get_account(self, account_number: str) -> Optional[Account]:
@@ -287,6 +445,10 @@ class Bank:
     
     def get_user_accounts(self, username: str) -> List[str]:
         """Get all account numbers associated with a username."""
+        return [account.account_number for account in self._account_holders.get(username, [])]
+    
+    def get_user_accounts_objs(self, username: str) -> List[Account]:
+        """Get all accounts associated with a username."""
         return self._account_holders.get(username, [])
     
     def transfer(self, sender_account_number: str, receiver_account_number: str, amount: float) -> bool:
@@ -316,24 +478,26 @@ class Bank:
         if not sender.is_active or not receiver.is_active:
             raise BankingError("One or both accounts are inactive")
         
-        # Perform transfer
-        sender.withdraw(amount)
-        receiver.deposit(amount)
+        sender._check_withdrawal(amount)
         
-        # Record transfer transactions
-        sender._add_transaction(TransactionType.TRANSFER_SENT, -amount)
-        receiver._add_transaction(TransactionType.TRANSFER_RECEIVED, amount)
+        # Perform transfer, recording both sides with the same timestamp
+        timestamp = time.time()
+        sender._apply_transfer(-amount, TransactionType.TRANSFER_SENT, timestamp)
+        receiver._apply_transfer(amount, TransactionType.TRANSFER_RECEIVED, timestamp)
         return True
     
     def calculate_all_interest(self):
         """Calculate and apply interest for all savings accounts."""
-        for account in self._accounts.values():
-            if isinstance(account, SavingsAccount) and account.is_active:
-                account.calculate_interest()
+        # Batch pass: rate and timestamp are looked up once for every account
+        monthly_rate = SavingsAccount.MONTHLY_RATE
+        timestamp = time.time()
+        for account in self._savings:
+            if account.is_active:
+                account._credit_interest(account._balance * monthly_rate, timestamp)
     
     def admin_check_total_deposit(self) -> float:
         """Return total balance of all accounts."""
-        return sum(account.get_balance() for account in self._accounts.values())
+        return self._stats['total_deposits']
     
     def admin_check_total_accounts(self) -> int:
         """Return total number of accounts."""
@@ -341,20 +505,16 @@ class Bank:
     
     def admin_get_account_stats(self) -> Dict:
         """Get detailed statistics about accounts."""
-        total_accounts = len(self._accounts)
-        active_accounts = sum(1 for acc in self._accounts.values() if acc.is_active)
-        savings_accounts = sum(1 for acc in self._accounts.values() 
-                             if isinstance(acc, SavingsAccount))
-        current_accounts = sum(1 for acc in self._accounts.values() 
-                             if isinstance(acc, CurrentAccount))
-        
+        stats = self._stats
+        savings_accounts = len(self._savings)
+        current_accounts = len(self._current)
         return {
-            "total_accounts": total_accounts,
-            "active_accounts": active_accounts,
-            "inactive_accounts": total_accounts - active_accounts,
+            "total_accounts": savings_accounts + current_accounts,
+            "active_accounts": stats['active'],
+            "inactive_accounts": stats['inactive'],
             "savings_accounts": savings_accounts,
             "current_accounts": current_accounts,
-            "total_deposits": self.admin_check_total_deposit()
+            "total_deposits": stats['total_deposits']
         }
 
 def main():
@@ -362,10 +522,9 @@ def main():
     
     def print_menu(menu_items: Dict[str, str]):
         """Print formatted menu."""
-        print("\n" + "=" * 40)
-        for key, value in menu_items.items():
-            print(f"{key}. {value}")
-        print("=" * 40)
+        separator = "=" * 40
+        entries = "\n".join(f"{key}. {value}" for key, value in menu_items.items())
+        print(f"\n{separator}\n{entries}\n{separator}")
     
     def get_validated_input(prompt: str, validation_func=None, error_msg: str = None) -> str:
         """Get and validate user input."""
@@ -440,9 +599,7 @@ def main():
                                 bank._validate_name,
                                 "Name must be 2-50 characters long and contain only letters and spaces."
                             )
-                            print("\nSelect Account Type:")
-                            print("1. Savings Account")
-                            print("2. Current Account")
+                            print("\nSelect Account Type:\n1. Savings Account\n2. Current Account")
                             acc_type = input("Enter choice (1/2): ")
                             
                             account_type = AccountType.SAVINGS if acc_type == "1" else AccountType.CURRENT
@@ -450,17 +607,17 @@ def main():
                             print(f"Account created successfully! Your account number is: {account_number}")
                         
                         elif user_choice == "2":  # View My Accounts
-                            accounts = bank.get_user_accounts(username)
+                            accounts = bank.get_user_accounts_objs(username)
                             if not accounts:
                                 print("You don't have any accounts yet.")
                             else:
-                                print("\nYour Accounts:")
-                                for acc_num in accounts:
-                                    account = bank.get_account(acc_num)
-                                    print(f"Account Number: {acc_num}")
-                                    print(f"Type: {account._account_type.value}")
-                                    print(f"Balance: ${account.get_balance():.2f}")
-                                    print(f"Status: {'Active' if account.is_active else 'Inactive'}\n")
+                                lines = ["\nYour Accounts:"]
+                                for account in accounts:
+                                    lines.append(f"Account Number: {account.account_number}")
+                                    lines.append(f"Type: {account._account_type_str}")
+                                    lines.append(f"Balance: ${account.get_balance():.2f}")
+                                    lines.append(f"Status: {'Active' if account.is_active else 'Inactive'}\n")
+                                print("\n".join(lines))
                         
                         elif user_choice == "3":  # Deposit Money
                             account_number = input("Enter account number: ")